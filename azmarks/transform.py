@@ -1,3 +1,101 @@
+import os
+
+# Fields of the intermediate resource format produced by azmarks.azure
+RESOURCE_FIELDS = (
+    "subscription_id",
+    "subscription_name",
+    "resource_group",
+    "provider",
+    "resource_type",
+    "resource_name",
+    "location",
+)
+
+
+def sort_key(title):
+    return str(title).casefold()
+
+
+def is_single_field_group(template):
+    """
+    Check whether every entry of a folder comes from one '{field:...}' group.
+
+    :param template: The structure template of the folder contents.
+    :return: True if the template holds a single field-keyed item and nothing else.
+    """
+    if isinstance(template, list) and len(template) == 1:
+        template = template[0]
+    return (
+        isinstance(template, dict)
+        and len(template) == 1
+        and "{field:" in next(iter(template))
+    )
+
+
+def unique_label(label, chunk, result):
+    """
+    Make a range label unique within a folder, so no entries are overwritten.
+
+    :param label: The preferred label.
+    :param chunk: The (title, value) pairs the label stands for.
+    :param result: The folder the label is added to.
+    :return: A label not yet present in result.
+    """
+    if label in result and len(chunk) > 1:
+        label = f"{chunk[0][0]}\u2013{chunk[-1][0]}"
+    candidate = label
+    count = 2
+    while candidate in result:
+        candidate = f"{label} ({count})"
+        count += 1
+    return candidate
+
+
+def split_folder(items, max_size):
+    """
+    Split an oversized folder into balanced alphabetical range sub-folders.
+
+    :param items: A list of (title, value) pairs, already sorted by title.
+    :param max_size: The maximum number of entries per folder.
+    :return: A dictionary with at most max_size entries.
+    """
+    if len(items) <= max_size:
+        return dict(items)
+
+    # Pick the bucket count from the depth needed for the whole set, so every
+    # bucket is filled evenly up to the capacity of the levels below it
+    capacity = max_size
+    while capacity * max_size < len(items):
+        capacity *= max_size
+    bucket_count = -(-len(items) // capacity)
+    size, extra = divmod(len(items), bucket_count)
+    chunks = []
+    start = 0
+    for index in range(bucket_count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+
+    # Label every range with the shortest prefix that tells all boundaries apart
+    length = 1
+    for previous, following in zip(chunks, chunks[1:]):
+        boundary = [sort_key(previous[-1][0]), sort_key(following[0][0])]
+        length = max(length, len(os.path.commonprefix(boundary)) + 1)
+
+    result = {}
+    for chunk in chunks:
+        # A single entry needs no folder of its own
+        if len(chunk) == 1:
+            title, value = chunk[0]
+            result[unique_label(title, chunk, result)] = value
+            continue
+        low = sort_key(chunk[0][0])[:length]
+        high = sort_key(chunk[-1][0])[:length]
+        label = low if low == high else f"{low}\u2013{high}"
+        result[unique_label(label, chunk, result)] = split_folder(chunk, max_size)
+    return result
+
+
 def transform(intermediate_data, config):
     base_url = config["base_url"]
 
@@ -14,6 +112,45 @@ def transform(intermediate_data, config):
 
     structure = config["structure"]
 
+    # Optional cap on folder size, splitting oversized folders into sub-folders
+    folder_split = config.get("folder_split") or {}
+    max_size = folder_split.get("max_size")
+    split_by = folder_split.get("split_by", "alphabetical")
+    if max_size is not None and (not isinstance(max_size, int) or max_size < 2):
+        raise ValueError(
+            f"Invalid folder_split max_size: {max_size}. It should be an integer of at least 2."
+        )
+    if split_by != "alphabetical" and split_by not in RESOURCE_FIELDS:
+        raise ValueError(
+            f"Invalid folder_split split_by: {split_by}. It should be 'alphabetical' or one of {', '.join(RESOURCE_FIELDS)}."
+        )
+
+    def split_group(value_template, data_list, folder):
+        # Split by a secondary field first, if it actually divides the group
+        if split_by != "alphabetical":
+            missing = f"(no {split_by})"
+            sub_groups = {}
+            for data in sorted(
+                data_list, key=lambda data: sort_key(data.get(split_by) or missing)
+            ):
+                sub_groups.setdefault(data.get(split_by) or missing, []).append(data)
+            if len(sub_groups) > 1:
+                result = []
+                for key_value, sub_data in sub_groups.items():
+                    sub_folder = process_structure(value_template, sub_data)
+                    if isinstance(sub_folder, dict) and len(sub_folder) > max_size:
+                        items = sorted(
+                            sub_folder.items(), key=lambda item: sort_key(item[0])
+                        )
+                        sub_folder = split_folder(items, max_size)
+                    result.append((key_value, sub_folder))
+                return split_folder(result, max_size)
+
+        # Otherwise fall back to alphabetical ranges over the folder entries
+        return split_folder(
+            sorted(folder.items(), key=lambda item: sort_key(item[0])), max_size
+        )
+
     def process_structure(structure, data_list):
         if isinstance(structure, dict):
             result = {}
@@ -34,6 +171,15 @@ def transform(intermediate_data, config):
                             f"{{field:{field_name}}}", key_value
                         )
                         new_value = process_structure(value_template, group_data)
+                        if (
+                            max_size is not None
+                            and is_single_field_group(value_template)
+                            and isinstance(new_value, dict)
+                            and len(new_value) > max_size
+                        ):
+                            new_value = split_group(
+                                value_template, group_data, new_value
+                            )
                         result[new_key] = new_value
                 else:
                     new_key = key_template
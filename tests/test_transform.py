@@ -1,4 +1,6 @@
-from azmarks.transform import transform
+import pytest
+
+from azmarks.transform import split_folder, transform
 
 
 def test_transform_1():
@@ -189,3 +191,231 @@ def test_transform_2():
     output = transform(intermediate_data, config)
 
     assert output == expected_output
+
+
+def test_transform_folder_split_alphabetical():
+    config = {
+        "base_url": "https://portal.azure.com/#@ksatno.onmicrosoft.com",
+        "links": [{"resource": "/{resource_type}/{resource_name}/"}],
+        "structure": [
+            {"{field:resource_type}": [{"{field:resource_name}": "{link:resource}"}]}
+        ],
+        "folder_split": {"max_size": 3},
+    }
+    names = ["delta", "Alpha", "echo", "bravo", "foxtrot", "charlie"]
+    intermediate_data = [
+        {"resource_type": "virtualMachines", "resource_name": name} for name in names
+    ]
+
+    base_url = "https://portal.azure.com/#@ksatno.onmicrosoft.com/virtualMachines"
+    expected_output = {
+        "virtualMachines": {
+            "a–c": {
+                "Alpha": f"{base_url}/Alpha/",
+                "bravo": f"{base_url}/bravo/",
+                "charlie": f"{base_url}/charlie/",
+            },
+            "d–f": {
+                "delta": f"{base_url}/delta/",
+                "echo": f"{base_url}/echo/",
+                "foxtrot": f"{base_url}/foxtrot/",
+            },
+        }
+    }
+
+    output = transform(intermediate_data, config)
+
+    assert output == expected_output
+
+
+def test_transform_folder_split_by_field():
+    config = {
+        "base_url": "https://portal.azure.com/#@ksatno.onmicrosoft.com",
+        "links": [{"resource": "/{location}/{resource_name}/"}],
+        "structure": [
+            {"{field:resource_type}": [{"{field:resource_name}": "{link:resource}"}]}
+        ],
+        "folder_split": {"max_size": 2, "split_by": "location"},
+    }
+    intermediate_data = [
+        {"resource_type": "servers", "resource_name": "sql1", "location": "westus"},
+        {"resource_type": "servers", "resource_name": "sql2", "location": "eastus"},
+        {"resource_type": "servers", "resource_name": "sql3", "location": "westus"},
+        {"resource_type": "servers", "resource_name": "sql4", "location": "westus"},
+        {"resource_type": "servers", "resource_name": "sql5", "location": "westus"},
+    ]
+
+    base_url = "https://portal.azure.com/#@ksatno.onmicrosoft.com"
+    expected_output = {
+        "servers": {
+            "eastus": {"sql2": f"{base_url}/eastus/sql2/"},
+            "westus": {
+                "sql1–sql3": {
+                    "sql1": f"{base_url}/westus/sql1/",
+                    "sql3": f"{base_url}/westus/sql3/",
+                },
+                "sql4–sql5": {
+                    "sql4": f"{base_url}/westus/sql4/",
+                    "sql5": f"{base_url}/westus/sql5/",
+                },
+            },
+        }
+    }
+
+    output = transform(intermediate_data, config)
+
+    assert output == expected_output
+
+
+def test_transform_folder_split_keeps_static_links():
+    config = {
+        "base_url": "https://portal.azure.com/#@ksatno.onmicrosoft.com",
+        "links": [
+            {"overview": "/resource/subscriptions/{subscription_id}/overview"},
+            {"resources": "/resource/subscriptions/{subscription_id}/resources"},
+            {"deployments": "/resource/subscriptions/{subscription_id}/subdeployments"},
+            {"resource": "/{resource_type}/{resource_name}/"},
+        ],
+        "structure": [
+            {
+                "{field:subscription_name}": [
+                    {"Overview": "{link:overview}"},
+                    {"Resources": "{link:resources}"},
+                    {"Deployments": "{link:deployments}"},
+                    {
+                        "{field:resource_type}": [
+                            {"{field:resource_name}": "{link:resource}"}
+                        ]
+                    },
+                ]
+            }
+        ],
+        "folder_split": {"max_size": 2, "split_by": "location"},
+    }
+    resources = [
+        ("components", "app1", "westus"),
+        ("servers", "sql1", "westus"),
+        ("servers", "sql2", "eastus"),
+        ("servers", "sql3", "eastus"),
+        ("vaults", "kv1", "westus"),
+        ("virtualMachines", "vm1", "westus"),
+    ]
+    intermediate_data = [
+        {
+            "subscription_id": "sub1",
+            "subscription_name": "Subscription One",
+            "resource_type": resource_type,
+            "resource_name": resource_name,
+            "location": location,
+        }
+        for resource_type, resource_name, location in resources
+    ]
+
+    base_url = "https://portal.azure.com/#@ksatno.onmicrosoft.com"
+    expected_output = {
+        "Subscription One": {
+            "Overview": f"{base_url}/resource/subscriptions/sub1/overview",
+            "Resources": f"{base_url}/resource/subscriptions/sub1/resources",
+            "Deployments": f"{base_url}/resource/subscriptions/sub1/subdeployments",
+            "components": {"app1": f"{base_url}/components/app1/"},
+            "servers": {
+                "eastus": {
+                    "sql2": f"{base_url}/servers/sql2/",
+                    "sql3": f"{base_url}/servers/sql3/",
+                },
+                "westus": {"sql1": f"{base_url}/servers/sql1/"},
+            },
+            "vaults": {"kv1": f"{base_url}/vaults/kv1/"},
+            "virtualMachines": {"vm1": f"{base_url}/virtualMachines/vm1/"},
+        }
+    }
+
+    output = transform(intermediate_data, config)
+
+    assert output == expected_output
+
+
+def test_transform_folder_split_invalid_config():
+    config = {
+        "base_url": "https://portal.azure.com/#@ksatno.onmicrosoft.com",
+        "links": [],
+        "structure": [],
+    }
+
+    for folder_split in ({"max_size": 1}, {"max_size": "10"}):
+        with pytest.raises(ValueError, match="max_size"):
+            transform([], {**config, "folder_split": folder_split})
+
+    with pytest.raises(ValueError, match="split_by"):
+        transform([], {**config, "folder_split": {"max_size": 2, "split_by": "rg"}})
+
+
+def test_transform_folder_split_by_field_fallback():
+    config = {
+        "base_url": "https://portal.azure.com/#@ksatno.onmicrosoft.com",
+        "links": [{"resource": "/{resource_name}/"}],
+        "structure": [
+            {"{field:resource_type}": [{"{field:resource_name}": "{link:resource}"}]}
+        ],
+        "folder_split": {"max_size": 2, "split_by": "resource_group"},
+    }
+    intermediate_data = [
+        {"resource_type": "servers", "resource_name": name, "resource_group": "rg1"}
+        for name in ["sql1", "sql2", "sql3", "sql4"]
+    ]
+
+    base_url = "https://portal.azure.com/#@ksatno.onmicrosoft.com"
+    expected_output = {
+        "servers": {
+            "sql1–sql2": {"sql1": f"{base_url}/sql1/", "sql2": f"{base_url}/sql2/"},
+            "sql3–sql4": {"sql3": f"{base_url}/sql3/", "sql4": f"{base_url}/sql4/"},
+        }
+    }
+
+    assert transform(intermediate_data, config) == expected_output
+
+    # Resources without the field are grouped under a visible title
+    intermediate_data[0]["resource_group"] = None
+    output = transform(intermediate_data, config)
+
+    assert output["servers"]["(no resource_group)"] == {"sql1": f"{base_url}/sql1/"}
+
+
+def test_split_folder_nested():
+    items = [(f"vm{index:02}", index) for index in range(10)]
+
+    output = split_folder(items, 3)
+
+    def flatten(folder):
+        for value in folder.values():
+            if isinstance(value, dict):
+                assert len(value) <= 3
+                yield from flatten(value)
+            else:
+                yield value
+
+    assert list(output) == ["vm00–vm04", "vm05–vm09"]
+    assert list(output["vm00–vm04"]) == ["vm00–vm02", "vm03–vm04"]
+    assert sorted(flatten(output)) == list(range(10))
+
+
+def test_split_folder_avoids_single_bookmark_folders():
+    items = [("abc001", 1), ("abc002", 2), ("abc003", 3), ("b", 4), ("c", 5)]
+
+    output = split_folder(items, 2)
+
+    assert output == {
+        "a": {"abc001–abc002": {"abc001": 1, "abc002": 2}, "abc003": 3},
+        "b–c": {"b": 4, "c": 5},
+    }
+
+
+def test_split_folder_label_collision():
+    items = [("VM1", 1), ("vm1", 2), ("Vm1", 3), ("vM1", 4)]
+
+    output = split_folder(items, 2)
+
+    assert output == {
+        "vm1": {"VM1": 1, "vm1": 2},
+        "Vm1–vM1": {"Vm1": 3, "vM1": 4},
+    }